@@ -14,22 +14,239 @@ Setup Instructions:
 4. Copy the Bot User OAuth Token (starts with xoxb-)
 5. Add the bot to your desired channel
 6. Set environment variable: SLACK_BOT_TOKEN
-7. Install required packages: pip install slack-sdk requests beautifulsoup4 schedule
+7. Install required packages: pip install slack-sdk aiohttp orjson beautifulsoup4 schedule
+8. Call configure_logging() before creating JobPostingBot; the bot reports progress
+   through the 'jobbot' logger and prints nothing without it
 """
 
 import os
-import requests
+import re
+import string
+import sys
+import logging
+import logging.handlers
+import signal
+import threading
+import itertools
+import functools
+import hashlib
+import sqlite3
+import asyncio
+import aiohttp
 from datetime import datetime
-from typing import List, Dict
+from collections import OrderedDict, defaultdict
+from typing import AsyncIterator, List, Dict, Optional
 from slack_sdk import WebClient
+from slack_sdk.web.async_client import AsyncWebClient
 from slack_sdk.errors import SlackApiError
+from slack_sdk.http_retry import default_retry_handlers
+from slack_sdk.http_retry.builtin_handlers import RateLimitErrorRetryHandler
+from slack_sdk.http_retry.builtin_async_handlers import (
+    AsyncRateLimitErrorRetryHandler, async_default_handlers
+)
+import schedule
 import time
 import json
+import orjson
+
+try:
+    # Optional: vectorized location filtering for large scrape batches
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+
+log = logging.getLogger('jobbot')
+
+
+# Pre-serialized Slack block JSON; %b slots take values already encoded with _jq
+_jq = orjson.dumps
+_HEADER_TMPL = (
+    b'{"type":"header","text":{"type":"plain_text","text":%b,"emoji":true}},'
+    b'{"type":"section","fields":['
+    b'{"type":"mrkdwn","text":%b},{"type":"mrkdwn","text":%b},'
+    b'{"type":"mrkdwn","text":%b},{"type":"mrkdwn","text":%b}]}'
+)
+_CONTEXT_TMPL = b'{"type":"context","elements":[{"type":"mrkdwn","text":%b}]}'
+_DESCRIPTION_TMPL = b'{"type":"section","text":{"type":"mrkdwn","text":%b}}'
+_BUTTON_TMPL = (
+    b'{"type":"section","text":{"type":"mrkdwn","text":" "},'
+    b'"accessory":{"type":"button","text":%b,"url":%b,"action_id":"apply_button"}},'
+    b'{"type":"divider"}'
+)
+_APPLY_BUTTON_TEXT = _jq({"type": "plain_text", "text": "Apply Now 🚀", "emoji": True})
+_VIEW_POST_BUTTON_TEXT = _jq({"type": "plain_text", "text": "View Post 👀", "emoji": True})
+
+# Source for the Slack block builders; $-placeholders are filled per post type
+_BLOCK_BUILDER_SOURCE = '''
+def build_blocks(job):
+    emoji = $EMOJI
+    parts = [_HEADER_TMPL % (
+        _jq(f"{emoji} {job['title']}"),
+        _jq(f"*Company:*\\n{job['company']}"),
+        _jq(f"*Location:*\\n{job['location']}"),
+        _jq(f"*Industry:*\\n{job.get('industry', 'N/A')}"),
+        _jq(f"*Posted:*\\n{job.get('posted_date', 'Recently')}")
+    )]
+$CONTEXT
+    description = job.get('description')
+    if description:
+        parts.append(_DESCRIPTION_TMPL % _jq(f"*Description:*\\n{description[:300]}..."))
+
+    parts.append(_BUTTON_TMPL % ($BUTTON_TEXT, _jq(job['url'])))
+    return (b'[' + b','.join(parts) + b']').decode()
+'''
+
+_NETWORK_CONTEXT_SOURCE = '''
+    if job.get('posted_by'):
+        parts.append(_CONTEXT_TMPL % _jq(
+            f"👤 Posted by: *{job['posted_by']}* ({job.get('connection_degree', 'Connection')})"
+        ))
+'''
+
+
+def _compile_block_builder(network: bool):
+    """
+    Generate a block builder specialized for network or job board posts, so
+    the is_network_post branches are resolved once instead of on every call
+
+    Args:
+        network: Build for LinkedIn network posts instead of job board posts
+
+    Returns:
+        Function mapping a job dictionary to its Slack message blocks as JSON
+    """
+    if network:
+        emoji = "'👥'"
+        context = _NETWORK_CONTEXT_SOURCE
+        button_text = '_VIEW_POST_BUTTON_TEXT'
+    else:
+        emoji = "'🌐' if 'remote' in job.get('location', '').lower() else '🎯'"
+        context = ''
+        button_text = '_APPLY_BUTTON_TEXT'
+
+    source = string.Template(_BLOCK_BUILDER_SOURCE).substitute(
+        EMOJI=emoji, CONTEXT=context, BUTTON_TEXT=button_text
+    )
+    namespace = {}
+    exec(compile(source, f'<block builder network={network}>', 'exec'), globals(), namespace)
+    return namespace['build_blocks']
+
+
+# Block builders keyed by is_network_post
+_BLOCK_BUILDERS = {False: _compile_block_builder(False), True: _compile_block_builder(True)}
+
+# Job fields the block builders read; the render cache is keyed on these only
+_BLOCK_FIELDS = ('title', 'company', 'location', 'industry', 'posted_date', 'description',
+                 'url', 'is_network_post', 'posted_by', 'connection_degree')
+_MISSING = object()
+
+
+# Maximum number of posted job IDs kept in memory in front of the SQLite store
+POSTED_JOBS_CACHE_SIZE = 10_000
+
+# Resolved channel IDs, keyed by token hash and channel name
+CHANNEL_CACHE_PATH = os.path.expanduser('~/.slack_chan_cache.json')
+
+# Posting errors that mean the resolved channel ID can no longer be used
+STALE_CHANNEL_ERRORS = {'channel_not_found', 'is_archived'}
+
+# Batches at least this large are location-filtered with pyarrow or numba when installed
+VECTORIZED_FILTER_MIN_BATCH = 256
+
+
+def _encode_fixed_width(strings: List[str]):
+    """
+    Lowercase and UTF-8 encode strings into a zero-padded uint8 matrix
+
+    Args:
+        strings: Strings to encode
+
+    Returns:
+        Tuple of the (n, longest) byte matrix and the per-row byte lengths
+    """
+    import numpy as np
+
+    encoded = [s.lower().encode() for s in strings]
+    width = max((len(e) for e in encoded), default=0) or 1
+    lengths = np.fromiter((len(e) for e in encoded), dtype=np.int64, count=len(encoded))
+    matrix = np.frombuffer(b''.join(e.ljust(width, b'\0') for e in encoded), dtype=np.uint8)
+    return matrix.reshape(len(encoded), width), lengths
+
+
+@functools.lru_cache(maxsize=None)
+def _numba_location_matcher():
+    """
+    Compile the numba location kernel on first use, so numba's heavy import is
+    only paid when pyarrow is missing and a large batch needs filtering
+
+    Returns:
+        The compiled kernel, or None if numba is not installed
+    """
+    try:
+        # Optional: JIT-compiled parallel location matching for large scrape batches
+        import numpy as np
+        from numba import njit, prange
+    except ImportError:
+        return None
+
+    @njit(parallel=True, cache=True)
+    def _match_any_bytes(texts, text_lengths, patterns, pattern_lengths):
+        """Flag rows of texts that contain any of the patterns (byte-wise scan)"""
+        out = np.zeros(texts.shape[0], dtype=np.bool_)
+        for i in prange(texts.shape[0]):
+            n = text_lengths[i]
+            for p in range(patterns.shape[0]):
+                m = pattern_lengths[p]
+                for start in range(n - m + 1):
+                    j = 0
+                    while j < m and texts[i, start + j] == patterns[p, j]:
+                        j += 1
+                    if j == m:
+                        out[i] = True
+                        break
+                if out[i]:
+                    break
+        return out
+
+    return _match_any_bytes
+
+
+class RateLimiter:
+    """Asyncio token bucket used to throttle requests to a single host"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Args:
+            rate: Tokens added per second
+            burst: Maximum number of tokens that can accumulate
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self):
+        """Wait until a token is available, then consume it"""
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
 
 class JobPostingBot:
     """Main bot class to handle job posting monitoring and Slack notifications"""
 
-    def __init__(self, slack_token: str, channel_name: str, linkedin_cookie: str = None):
+    def __init__(self, slack_token: str, channel_name: str, linkedin_cookie: str = None,
+                 db_path: str = 'posted_jobs.db'):
         """
         Initialize the bot with Slack credentials
 
@@ -37,13 +254,43 @@ class JobPostingBot:
             slack_token: Slack Bot User OAuth Token (xoxb-...)
             channel_name: Channel name without # (e.g., 'job-alerts')
             linkedin_cookie: LinkedIn session cookie for accessing network posts (optional)
+            db_path: SQLite file used to remember posted jobs across restarts
         """
-        self.client = WebClient(token=slack_token)
+        # Let the SDK honor Slack's Retry-After on HTTP 429 instead of sleeping blindly,
+        # on top of its default connection-error retries
+        self.client = WebClient(
+            token=slack_token,
+            retry_handlers=default_retry_handlers() + [RateLimitErrorRetryHandler(max_retry_count=3)]
+        )
+        self._slack_token = slack_token
+        # Groups are posted concurrently but paced to Slack's ~1 msg/sec per
+        # channel; the 429 retry handler is only a fallback
+        self.max_concurrent_posts = 5
+        self.slack_posts_per_second = 1
+        self.max_post_retries = 3
+        self.slack_timeout = aiohttp.ClientTimeout(total=30)
         self.channel_name = channel_name
         self.channel_id = None
-        self.posted_jobs = set()  # Track posted jobs to avoid duplicates
+        self._channel_cache_key = (
+            f"{hashlib.sha256(slack_token.encode()).hexdigest()[:16]}:{channel_name}"
+        )
+        # Track posted jobs to avoid duplicates: a bounded LRU in front of SQLite
+        self.posted_jobs = OrderedDict()
+        # Access is serialized, but run_scheduled may run on a different thread
+        # than the one that built the bot
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._db.execute('CREATE TABLE IF NOT EXISTS posted (job_id BLOB PRIMARY KEY, ts INTEGER)')
+        self._db.commit()
+        # Per-instance cache of rendered blocks, keyed by the fields they use
+        self._format_blocks_cached = functools.lru_cache(maxsize=1024)(self._format_blocks)
         self.linkedin_cookie = linkedin_cookie
 
+        # HTTP settings shared by all scrapers
+        self.http_headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        }
+        self.http_timeout = aiohttp.ClientTimeout(total=10)
+
         # Job search parameters
         self.target_roles = ["product manager", "senior product manager", 
                             "lead product manager", "principal product manager",
@@ -52,6 +299,72 @@ class JobPostingBot:
                                  "health tech", "education", "edtech"]
         self.target_locations = ["bangalore", "bengaluru", "pune", "chennai", 
                                 "hyderabad", "remote", "hybrid", "work from home"]
+        self.search_locations = ("Bangalore", "Pune", "Chennai", "Hyderabad", "Remote India")
+
+        # Every (query, location) pair searched on each job board, built once
+        self._scrape_tasks = tuple(
+            (f"{role} {industry}", location)
+            for role, industry, location in itertools.product(
+                self.target_roles, self.target_industries, self.search_locations
+            )
+        )
+        # One alternation shared by Python's re and Arrow's RE2 engine, escaping
+        # only metacharacters since RE2 rejects re.escape's escaped spaces
+        self._location_pattern = '|'.join(
+            re.sub(r'([\\.^$|?*+()\[\]{}])', r'\\\1', loc) for loc in self.target_locations
+        )
+        self._location_re = re.compile(self._location_pattern, re.IGNORECASE)
+        # Encoded for the numba kernel on first use
+        self._location_bytes = None
+
+        # Per-host concurrency and rate limits for job board scraping
+        self.max_requests_per_host = 8
+        self.requests_per_second = 2
+
+        # Scheduling state for run_scheduled
+        self._scheduler = schedule.Scheduler()
+        self._stop_event = threading.Event()
+        self._previous_handlers = {}
+
+    def _load_channel_cache(self) -> Dict:
+        """Read the on-disk channel ID cache, treating a missing or corrupt file as empty"""
+        try:
+            with open(CHANNEL_CACHE_PATH) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_channel_cache(self, cache: Dict):
+        """Write the channel ID cache back to disk, warning if that fails"""
+        try:
+            with open(CHANNEL_CACHE_PATH, 'w') as f:
+                json.dump(cache, f)
+        except OSError as e:
+            log.warning(f"⚠️  Could not write channel cache: {e}")
+
+    def _save_channel_id(self, channel_id: str):
+        """Persist a resolved channel ID so later starts skip conversations.list"""
+        cache = self._load_channel_cache()
+        cache[self._channel_cache_key] = channel_id
+        self._write_channel_cache(cache)
+
+    def _forget_channel_id(self):
+        """Drop the cached channel ID so the next run looks the channel up again"""
+        self.channel_id = None
+        cache = self._load_channel_cache()
+        if cache.pop(self._channel_cache_key, None) is not None:
+            self._write_channel_cache(cache)
+
+    def _handle_slack_error(self, e: SlackApiError):
+        """Log a Slack API error, forgetting the channel ID if it has gone stale"""
+        error = e.response['error']
+        log.error(f"✗ Slack API Error: {error}")
+        if error == 'not_in_channel':
+            # The channel ID is still valid; looking it up again would not help
+            log.warning(f"⚠️  The bot was removed from #{self.channel_name}; add it back to the channel")
+        elif error in STALE_CHANNEL_ERRORS and self.channel_id:
+            log.warning(f"⚠️  Channel #{self.channel_name} will be looked up again next run")
+            self._forget_channel_id()
 
     def get_channel_id(self) -> str:
         """
@@ -60,157 +373,292 @@ class JobPostingBot:
         Returns:
             str: Channel ID
         """
-        try:
-            # Call conversations.list API
-            result = self.client.conversations_list()
+        cached_id = self._load_channel_cache().get(self._channel_cache_key)
+        if cached_id:
+            self.channel_id = cached_id
+            log.info(f"✓ Found channel #{self.channel_name} (ID: {self.channel_id}, cached)")
+            return self.channel_id
 
-            for channel in result.get('channels', []):
-                if channel['name'] == self.channel_name:
-                    self.channel_id = channel['id']
-                    print(f"✓ Found channel #{self.channel_name} (ID: {self.channel_id})")
+        try:
+            # Page through public, non-archived channels only, stopping at the first match
+            cursor = None
+            while True:
+                result = self.client.conversations_list(
+                    types='public_channel',
+                    exclude_archived=True,
+                    limit=1000,
+                    cursor=cursor
+                )
+
+                channels = {channel['name']: channel['id'] for channel in result.get('channels', [])}
+                if self.channel_name in channels:
+                    self.channel_id = channels[self.channel_name]
+                    self._save_channel_id(self.channel_id)
+                    log.info(f"✓ Found channel #{self.channel_name} (ID: {self.channel_id})")
                     return self.channel_id
 
+                cursor = result.get('response_metadata', {}).get('next_cursor')
+                if not cursor:
+                    break
+
             raise Exception(f"Channel '{self.channel_name}' not found. "
                           f"Make sure the bot is added to the channel.")
         except SlackApiError as e:
             raise Exception(f"Error fetching channels: {e.response['error']}")
 
-    def format_job_message(self, job: Dict) -> Dict:
+    def format_job_message(self, job: Dict) -> str:
         """
         Format job data into a rich Slack message block
 
+        Identical jobs (e.g. retries or resends) reuse the cached output.
+
         Args:
             job: Dictionary containing job details
 
         Returns:
-            Dict: Formatted Slack message blocks
+            str: Formatted Slack message blocks, serialized as a JSON array
+        """
+        key = tuple(job.get(field, _MISSING) for field in _BLOCK_FIELDS)
+        try:
+            return self._format_blocks_cached(key)
+        except TypeError:
+            # Unhashable field values can't be cached; render directly instead
+            return _BLOCK_BUILDERS[bool(job.get('is_network_post'))](job)
+
+    def _format_blocks(self, key: tuple) -> str:
+        """
+        Build the Slack message blocks for a job
+
+        Args:
+            key: The job's values for _BLOCK_FIELDS, _MISSING where absent
+
+        Returns:
+            str: Formatted Slack message blocks, serialized as a JSON array
         """
-        # Determine emoji based on job source/type
-        emoji = "🎯"
-        if job.get('is_network_post'):
-            emoji = "👥"  # Network connection emoji
-        elif "remote" in job.get('location', '').lower():
-            emoji = "🌐"  # Remote work emoji
+        job = {field: value for field, value in zip(_BLOCK_FIELDS, key) if value is not _MISSING}
+        return _BLOCK_BUILDERS[bool(job.get('is_network_post'))](job)
 
-        # Create rich message blocks for better presentation
-        blocks = [
-            {
-                "type": "header",
-                "text": {
-                    "type": "plain_text",
-                    "text": f"{emoji} {job['title']}",
-                    "emoji": True
-                }
-            },
-            {
-                "type": "section",
-                "fields": [
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*Company:*\n{job['company']}"
-                    },
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*Location:*\n{job['location']}"
-                    },
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*Industry:*\n{job.get('industry', 'N/A')}"
-                    },
-                    {
-                        "type": "mrkdwn",
-                        "text": f"*Posted:*\n{job.get('posted_date', 'Recently')}"
-                    }
-                ]
-            }
-        ]
+    def _job_id(self, job: Dict) -> bytes:
+        """
+        Create unique job identifier to prevent duplicates; a blake2b digest
+        is stable across restarts and can't collide on '_' in fields
 
-        # Add network connection info if available
-        if job.get('is_network_post') and job.get('posted_by'):
-            blocks.append({
-                "type": "context",
-                "elements": [
-                    {
-                        "type": "mrkdwn",
-                        "text": f"👤 Posted by: *{job['posted_by']}* ({job.get('connection_degree', 'Connection')})"
-                    }
-                ]
-            })
-
-        # Add description if available
-        if job.get('description'):
-            blocks.append({
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"*Description:*\n{job['description'][:300]}..."
-                }
-            })
-
-        # Add apply button
-        blocks.append({
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": " "
-            },
-            "accessory": {
-                "type": "button",
-                "text": {
-                    "type": "plain_text",
-                    "text": "Apply Now 🚀" if not job.get('is_network_post') else "View Post 👀",
-                    "emoji": True
-                },
-                "url": job['url'],
-                "action_id": "apply_button"
-            }
-        })
+        Args:
+            job: Dictionary containing job details
 
-        blocks.append({"type": "divider"})
+        Returns:
+            bytes: Job identifier
+        """
+        key = b'\0'.join(job[field].encode() for field in ('company', 'title', 'location'))
+        return hashlib.blake2b(key, digest_size=16).digest()
+
+    def _is_posted(self, job_id: bytes) -> bool:
+        """
+        Check whether a job has already been posted
+
+        Args:
+            job_id: Identifier from _job_id
+
+        Returns:
+            bool: True if the job was posted before, False otherwise
+        """
+        if job_id in self.posted_jobs:
+            self.posted_jobs.move_to_end(job_id)
+            return True
+
+        row = self._db.execute('SELECT 1 FROM posted WHERE job_id = ?', (job_id,)).fetchone()
+        if row:
+            self._remember_posted(job_id)
+            return True
+        return False
+
+    def _remember_posted(self, job_id: bytes):
+        """Add a job ID to the in-memory LRU, evicting the oldest if full"""
+        self.posted_jobs[job_id] = None
+        self.posted_jobs.move_to_end(job_id)
+        if len(self.posted_jobs) > POSTED_JOBS_CACHE_SIZE:
+            self.posted_jobs.popitem(last=False)
+
+    def _mark_posted(self, job_id: bytes):
+        """
+        Record a job as posted in SQLite and the in-memory LRU
+
+        Args:
+            job_id: Identifier from _job_id
+        """
+        self._db.execute('INSERT OR IGNORE INTO posted (job_id, ts) VALUES (?, ?)',
+                         (job_id, int(time.time())))
+        self._db.commit()
+        self._remember_posted(job_id)
+
+    async def post_thread_parent(self, client: AsyncWebClient, industry: str, source: str,
+                                 count: int) -> Optional[str]:
+        """
+        Post a summary message that a group of job postings is threaded under
+
+        Args:
+            client: Async Slack client for the current posting run
+            industry: Industry shared by the grouped jobs
+            source: Source shared by the grouped jobs
+            count: Number of jobs in the group
+
+        Returns:
+            str: Timestamp of the parent message, or None if posting failed
+        """
+        text = f"📋 {count} new {industry} job{'s' if count != 1 else ''} from {source}"
+        try:
+            response = await client.chat_postMessage(
+                channel=self.channel_id,
+                text=text,
+                unfurl_links=False
+            )
+            if response['ok']:
+                return response['ts']
+            log.error(f"✗ Failed to post: {response}")
+        except SlackApiError as e:
+            self._handle_slack_error(e)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            log.error(f"✗ Slack request failed: {e!r}")
+        return None
 
-        return blocks
+    async def delete_message(self, client: AsyncWebClient, ts: str):
+        """
+        Delete a message the bot posted, e.g. a thread parent whose replies all failed
 
-    def send_job_to_slack(self, job: Dict) -> bool:
+        Args:
+            client: Async Slack client for the current posting run
+            ts: Timestamp of the message to delete
+        """
+        try:
+            await client.chat_delete(channel=self.channel_id, ts=ts)
+        except SlackApiError as e:
+            self._handle_slack_error(e)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            log.error(f"✗ Slack request failed: {e!r}")
+
+    async def send_job_to_slack(self, client: AsyncWebClient, job: Dict,
+                                thread_ts: str = None) -> bool:
         """
         Send a job posting to the Slack channel
 
         Args:
+            client: Async Slack client for the current posting run
             job: Dictionary containing job details
+            thread_ts: Timestamp of a parent message to reply under (optional)
 
         Returns:
             bool: True if successful, False otherwise
         """
         try:
-            # Create unique job identifier to prevent duplicates
-            job_id = f"{job['company']}_{job['title']}_{job['location']}"
+            job_id = self._job_id(job)
 
-            if job_id in self.posted_jobs:
-                print(f"⊘ Skipping duplicate: {job['title']} at {job['company']}")
+            if self._is_posted(job_id):
+                log.info(f"⊘ Skipping duplicate: {job['title']} at {job['company']}")
                 return False
 
-            # Format the message
+            # Format the message; it is already a JSON string, which the SDK
+            # passes through instead of re-encoding the blocks
             blocks = self.format_job_message(job)
 
             # Send to Slack
-            response = self.client.chat_postMessage(
+            response = await client.chat_postMessage(
                 channel=self.channel_id,
                 text=f"New Job: {job['title']} at {job['company']}",  # Fallback text
                 blocks=blocks,
+                thread_ts=thread_ts,
                 unfurl_links=False
             )
 
             if response['ok']:
-                self.posted_jobs.add(job_id)
-                tag = "👥" if job.get('is_network_post') else "✓"
-                print(f"{tag} Posted: {job['title']} at {job['company']}")
+                self._mark_posted(job_id)
+                log.debug(f"Posted: {job['title']} at {job['company']}")
                 return True
             else:
-                print(f"✗ Failed to post: {response}")
+                log.error(f"✗ Failed to post: {response}")
                 return False
 
         except SlackApiError as e:
-            print(f"✗ Slack API Error: {e.response['error']}")
+            self._handle_slack_error(e)
             return False
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            log.error(f"✗ Slack request failed: {e!r}")
+            return False
+
+    async def _post_group(self, client: AsyncWebClient, semaphore: asyncio.Semaphore,
+                          rate_limiter: RateLimiter, industry: str, source: str,
+                          jobs: List[Dict]) -> List[Dict]:
+        """
+        Post one group's parent message, then its jobs as thread replies in order
+
+        A single-job group is posted directly without a parent, and a parent
+        whose replies all fail is deleted so no empty summary is left behind.
+
+        Args:
+            client: Async Slack client for the current posting run
+            semaphore: Bounds the number of in-flight Slack requests
+            rate_limiter: Paces requests to the channel across all groups
+            industry: Industry shared by the grouped jobs
+            source: Source shared by the grouped jobs
+            jobs: Jobs in the group
+
+        Returns:
+            List of the jobs that were posted
+        """
+        if len(jobs) == 1:
+            async with semaphore:
+                await rate_limiter.acquire()
+                posted = await self.send_job_to_slack(client, jobs[0])
+            return jobs if posted else []
+
+        async with semaphore:
+            await rate_limiter.acquire()
+            thread_ts = await self.post_thread_parent(client, industry, source, len(jobs))
+        if not thread_ts:
+            return []
+
+        # Replies go out one at a time so they keep their order in the thread
+        posted_jobs = []
+        for job in jobs:
+            async with semaphore:
+                await rate_limiter.acquire()
+                if await self.send_job_to_slack(client, job, thread_ts=thread_ts):
+                    posted_jobs.append(job)
+        if not posted_jobs:
+            async with semaphore:
+                await rate_limiter.acquire()
+                await self.delete_message(client, thread_ts)
+        return posted_jobs
+
+    async def post_jobs_async(self, groups: Dict) -> List[Dict]:
+        """
+        Post grouped jobs to Slack over one pooled connection. Groups are posted
+        concurrently, with at most max_concurrent_posts requests in flight, and
+        paced to slack_posts_per_second; any 429s that still occur are retried
+        by the client up to max_post_retries times
+
+        Args:
+            groups: Mapping of (industry, source) to the jobs in that group
+
+        Returns:
+            List of the jobs that were posted
+        """
+        # The SDK ignores its own timeout when handed a session, so set it here
+        async with aiohttp.ClientSession(timeout=self.slack_timeout) as session:
+            client = AsyncWebClient(
+                token=self._slack_token,
+                session=session,
+                retry_handlers=async_default_handlers() + [
+                    AsyncRateLimitErrorRetryHandler(max_retry_count=self.max_post_retries)
+                ]
+            )
+            # Created per run since asyncio primitives bind to one event loop
+            semaphore = asyncio.Semaphore(self.max_concurrent_posts)
+            rate_limiter = RateLimiter(rate=self.slack_posts_per_second)
+            posted = await asyncio.gather(
+                *(self._post_group(client, semaphore, rate_limiter, industry, source, group_jobs)
+                  for (industry, source), group_jobs in groups.items())
+            )
+        return [job for group_posted in posted for job in group_posted]
 
     def matches_location_filter(self, location: str) -> bool:
         """
@@ -222,28 +670,62 @@ class JobPostingBot:
         Returns:
             bool: True if location matches, False otherwise
         """
-        location_lower = location.lower()
-        return any(target_loc in location_lower for target_loc in self.target_locations)
+        return self._location_re.search(location) is not None
+
+    def filter_by_location(self, jobs: List[Dict]) -> List[Dict]:
+        """
+        Keep only jobs whose location matches our target locations
+
+        Large batches are matched in a single pyarrow kernel pass when
+        pyarrow is installed, else by a parallel numba kernel when numba is;
+        smaller ones use the precompiled regex.
+
+        Args:
+            jobs: List of job dictionaries
 
-    def scrape_linkedin_network_posts(self) -> List[Dict]:
+        Returns:
+            List of job dictionaries that match the location filter
+        """
+        if len(jobs) < VECTORIZED_FILTER_MIN_BATCH:
+            return [job for job in jobs if self.matches_location_filter(job['location'])]
+
+        if pa is not None:
+            locations = pa.array([job['location'] for job in jobs], type=pa.string())
+            mask = pc.match_substring_regex(locations, pattern=self._location_pattern,
+                                            ignore_case=True)
+            return list(itertools.compress(jobs, mask.to_pylist()))
+
+        match_any_bytes = _numba_location_matcher()
+        if match_any_bytes is None:
+            return [job for job in jobs if self.matches_location_filter(job['location'])]
+
+        if self._location_bytes is None:
+            self._location_bytes = _encode_fixed_width(self.target_locations)
+        texts, text_lengths = _encode_fixed_width([job['location'] for job in jobs])
+        mask = match_any_bytes(texts, text_lengths, *self._location_bytes)
+        return list(itertools.compress(jobs, mask))
+
+    async def scrape_linkedin_network_posts(self, session: aiohttp.ClientSession) -> AsyncIterator[Dict]:
         """
         Scrape LinkedIn posts from your network about hiring for Product/Growth roles
         Note: This requires LinkedIn authentication
 
-        Returns:
-            List of job dictionaries from network posts
+        Args:
+            session: Shared aiohttp session
+
+        Yields:
+            Job dictionaries from network posts, as each one passes the location filter
         """
         if not self.linkedin_cookie:
-            print("⚠️  LinkedIn cookie not provided. Skipping network posts.")
-            return []
+            log.warning("⚠️  LinkedIn cookie not provided. Skipping network posts.")
+            return
 
         jobs = []
 
-        # LinkedIn feed URL
-        headers = {
-            'Cookie': self.linkedin_cookie,
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
+        # LinkedIn feed requests go through the shared session, with the
+        # cookie passed per request so it is never sent to other hosts
+        headers = {'Cookie': self.linkedin_cookie}
+        # e.g. async with session.get(url, headers=headers) as r: html = await r.text()
 
         # Note: In production, you would:
         # 1. Use LinkedIn's official API if you have access
@@ -281,20 +763,23 @@ class JobPostingBot:
             }
         ]
 
-        # Filter by location only (no industry filter for network posts)
-        filtered_jobs = [
-            job for job in sample_network_jobs 
-            if self.matches_location_filter(job['location'])
-        ]
+        # Filter by location only (no industry filter for network posts),
+        # streaming matches out instead of collecting the whole response first
+        found = 0
+        for job in sample_network_jobs:
+            if self.matches_location_filter(job['location']):
+                found += 1
+                yield job
 
-        print(f"✓ Found {len(filtered_jobs)} network hiring posts (location-filtered)")
-        return filtered_jobs
+        log.info(f"✓ Found {found} network hiring posts (location-filtered)")
 
-    def scrape_linkedin_jobs(self, keywords: str, location: str = "India") -> List[Dict]:
+    async def scrape_linkedin_jobs(self, session: aiohttp.ClientSession, keywords: str,
+                                   location: str = "India") -> List[Dict]:
         """
         Scrape job postings from LinkedIn (via public search)
 
         Args:
+            session: Shared aiohttp session
             keywords: Job search keywords
             location: Location to search
 
@@ -303,7 +788,7 @@ class JobPostingBot:
         """
         jobs = []
 
-        # Example job data structure (in production, implement actual scraping or use API)
+        # Example job data structure (in production, fetch via session or use API)
         sample_jobs = [
             {
                 "title": "Senior Product Manager - Healthcare",
@@ -341,18 +826,17 @@ class JobPostingBot:
         ]
 
         # Filter by location
-        filtered_jobs = [
-            job for job in sample_jobs 
-            if self.matches_location_filter(job['location'])
-        ]
+        filtered_jobs = self.filter_by_location(sample_jobs)
 
         return filtered_jobs
 
-    def scrape_indeed_jobs(self, keywords: str, location: str = "India") -> List[Dict]:
+    async def scrape_indeed_jobs(self, session: aiohttp.ClientSession, keywords: str,
+                                 location: str = "India") -> List[Dict]:
         """
         Scrape job postings from Indeed
 
         Args:
+            session: Shared aiohttp session
             keywords: Job search keywords
             location: Location to search
 
@@ -388,13 +872,32 @@ class JobPostingBot:
         ]
 
         # Filter by location
-        filtered_jobs = [
-            job for job in sample_jobs 
-            if self.matches_location_filter(job['location'])
-        ]
+        filtered_jobs = self.filter_by_location(sample_jobs)
 
         return filtered_jobs
 
+    async def _rate_limited_scrape(self, limits: Dict, host: str, scraper,
+                                   session: aiohttp.ClientSession, keywords: str,
+                                   location: str) -> List[Dict]:
+        """
+        Run a job board scraper once a request slot for its host is available
+
+        Args:
+            limits: Mapping of host to its (semaphore, rate limiter) pair
+            host: Key into limits
+            scraper: Bound scrape_*_jobs coroutine method to call
+            session: Shared aiohttp session
+            keywords: Job search keywords
+            location: Location to search
+
+        Returns:
+            List of job dictionaries
+        """
+        semaphore, rate_limiter = limits[host]
+        async with semaphore:
+            await rate_limiter.acquire()
+            return await scraper(session, keywords, location)
+
     def fetch_all_jobs(self) -> List[Dict]:
         """
         Fetch jobs from all sources
@@ -402,57 +905,80 @@ class JobPostingBot:
         Returns:
             List of all job postings
         """
-        all_jobs = []
-
-        print("\n🔍 Fetching jobs from multiple sources...")
-
-        # 1. Fetch LinkedIn network posts (Product/Growth roles, location filter only)
-        print("\n📱 Checking LinkedIn network posts...")
-        network_jobs = self.scrape_linkedin_network_posts()
-        all_jobs.extend(network_jobs)
-
-        # 2. Fetch regular job postings (with industry filter)
-        print("\n🔎 Searching job boards...")
-        for role in self.target_roles:
-            for industry in self.target_industries:
-                for location in ["Bangalore", "Pune", "Chennai", "Hyderabad", "Remote India"]:
-                    query = f"{role} {industry}"
-
-                    # Fetch from LinkedIn
-                    linkedin_jobs = self.scrape_linkedin_jobs(query, location)
-                    all_jobs.extend(linkedin_jobs)
-
-                    # Fetch from Indeed
-                    indeed_jobs = self.scrape_indeed_jobs(query, location)
-                    all_jobs.extend(indeed_jobs)
-
-                    # Add delay to respect rate limits
-                    time.sleep(2)
+        return asyncio.run(self.fetch_all_jobs_async())
 
-        # Remove duplicates based on title and company
-        unique_jobs = []
-        seen = set()
+    async def fetch_all_jobs_async(self) -> List[Dict]:
+        """
+        Fetch jobs from all sources concurrently
 
-        for job in all_jobs:
-            identifier = f"{job['title']}_{job['company']}"
-            if identifier not in seen:
-                seen.add(identifier)
-                unique_jobs.append(job)
+        Returns:
+            List of all job postings
+        """
+        # Jobs keyed by (title, company) so duplicates are dropped as they arrive
+        unique_jobs: Dict[tuple, Dict] = {}
+
+        log.info("\n🔍 Fetching jobs from multiple sources...")
+
+        connector = aiohttp.TCPConnector(limit_per_host=self.max_requests_per_host,
+                                         ttl_dns_cache=300)
+        async with aiohttp.ClientSession(connector=connector, headers=self.http_headers,
+                                         timeout=self.http_timeout) as session:
+            # 1. Fetch LinkedIn network posts (Product/Growth roles, location filter only)
+            log.info("\n📱 Checking LinkedIn network posts...")
+            async for job in self.scrape_linkedin_network_posts(session):
+                unique_jobs.setdefault((job['title'], job['company']), job)
+
+            # 2. Fetch regular job postings (with industry filter)
+            log.info("\n🔎 Searching job boards...")
+            boards = (('linkedin', self.scrape_linkedin_jobs), ('indeed', self.scrape_indeed_jobs))
+
+            # Limits are created per run since asyncio primitives bind to one event loop
+            limits = {
+                host: (asyncio.Semaphore(self.max_requests_per_host),
+                       RateLimiter(rate=self.requests_per_second,
+                                   burst=self.max_requests_per_host))
+                for host, _ in boards
+            }
+            scrapes = asyncio.gather(
+                *(self._rate_limited_scrape(limits, host, scraper, session, query, location)
+                  for query, location in self._scrape_tasks
+                  for host, scraper in boards),
+                return_exceptions=True
+            )
 
-        network_count = sum(1 for job in unique_jobs if job.get('is_network_post'))
+            # Abandon outstanding scrapes promptly if the bot is asked to stop
+            while not scrapes.done():
+                if self._stop_event.is_set():
+                    scrapes.cancel()
+                    break
+                await asyncio.wait({scrapes}, timeout=0.5)
+            try:
+                results = await scrapes
+            except asyncio.CancelledError:
+                log.info("⏹  Stop requested; abandoned remaining job board searches")
+                results = []
+
+        for result in results:
+            if isinstance(result, Exception):
+                log.error(f"✗ Scrape failed: {result}")
+                continue
+            for job in result:
+                unique_jobs.setdefault((job['title'], job['company']), job)
+
+        network_count = sum(1 for job in unique_jobs.values() if job.get('is_network_post'))
         regular_count = len(unique_jobs) - network_count
 
-        print(f"\n✓ Found {len(unique_jobs)} unique job postings:")
-        print(f"  - {network_count} from network connections")
-        print(f"  - {regular_count} from job boards")
+        log.info(f"\n✓ Found {len(unique_jobs)} unique job postings:\n"
+                 f"  - {network_count} from network connections\n"
+                 f"  - {regular_count} from job boards")
 
-        return unique_jobs
+        return list(unique_jobs.values())
 
     def run_once(self):
         """Run the bot once to fetch and post jobs"""
-        print(f"\n{'='*60}")
-        print(f"Job Posting Bot - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"{'='*60}")
+        log.info(f"\n{'='*60}\n"
+                 f"Job Posting Bot - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+                 f"{'='*60}")
 
         # Get channel ID if not already set
         if not self.channel_id:
@@ -461,15 +987,66 @@ class JobPostingBot:
         # Fetch jobs
         jobs = self.fetch_all_jobs()
 
-        # Post to Slack
-        posted_count = 0
+        if self._stop_event.is_set():
+            log.info("⏹  Stop requested; skipping posting")
+            _flush_log()
+            return
+
+        # Group new jobs by industry and source so each group of several jobs
+        # is a single channel message with the postings as thread replies
+        # Per-job lines are collected and logged in one call after posting
+        lines = []
+        groups = defaultdict(list)
         for job in jobs:
-            if self.send_job_to_slack(job):
-                posted_count += 1
-                time.sleep(1)  # Rate limiting
+            if self._is_posted(self._job_id(job)):
+                lines.append(f"⊘ Skipping duplicate: {job['title']} at {job['company']}")
+                continue
+            groups[(job.get('industry', 'N/A'), job.get('source', 'Unknown'))].append(job)
 
-        print(f"\n📊 Summary: Posted {posted_count} new jobs to #{self.channel_name}")
-        print(f"{'='*60}\n")
+        # Post to Slack
+        posted_jobs = asyncio.run(self.post_jobs_async(groups))
+        posted_count = len(posted_jobs)
+        for job in posted_jobs:
+            tag = "👥" if job.get('is_network_post') else "✓"
+            lines.append(f"{tag} Posted: {job['title']} at {job['company']}")
+
+        if lines:
+            log.info("\n".join(lines))
+        log.info(f"\n📊 Summary: Posted {posted_count} new jobs to #{self.channel_name}\n"
+                 f"{'='*60}\n")
+
+        # Push out anything still buffered at the end of each run
+        _flush_log()
+
+    def _run_once_safely(self):
+        """Run once from the scheduler, queueing a one-off retry if it fails"""
+        try:
+            self.run_once()
+        except Exception as e:
+            log.error(f"\n❌ Error: {e}\nRetrying in 5 minutes...\n")
+            self._scheduler.every(5).minutes.do(self._retry_once)
+
+    def _retry_once(self):
+        """One-off retry job that removes itself after running"""
+        self._run_once_safely()
+        return schedule.CancelJob
+
+    def stop(self):
+        """Ask run_scheduled to exit, winding down any run in progress"""
+        self._stop_event.set()
+
+    def _handle_stop_signal(self, signum, frame):
+        """
+        First SIGINT/SIGTERM stops gracefully; a second one restores the
+        previous handler and interrupts the current run immediately
+        """
+        if self._stop_event.is_set():
+            signal.signal(signum, self._previous_handlers.pop(signum, signal.SIG_DFL))
+            raise KeyboardInterrupt
+
+        log.warning("\n⏹  Stopping... (press Ctrl-C again to force)")
+        _flush_log()
+        self.stop()
 
     def run_scheduled(self, interval_hours: int = 24):
         """
@@ -478,27 +1055,71 @@ class JobPostingBot:
         Args:
             interval_hours: How often to check for new jobs (in hours)
         """
-        print(f"🤖 Bot started! Checking for jobs every {interval_hours} hours...")
-        print(f"📢 Posting to channel: #{self.channel_name}\n")
+        log.info(f"🤖 Bot started! Checking for jobs every {interval_hours} hours...\n"
+                 f"📢 Posting to channel: #{self.channel_name}\n")
 
-        while True:
-            try:
-                self.run_once()
-                print(f"💤 Sleeping for {interval_hours} hours...\n")
-                time.sleep(interval_hours * 3600)
-            except KeyboardInterrupt:
-                print("\n👋 Bot stopped by user")
-                break
-            except Exception as e:
-                print(f"\n❌ Error: {e}")
-                print(f"Retrying in 5 minutes...\n")
-                time.sleep(300)
+        self._stop_event.clear()
+        self._scheduler.clear()
+        self._scheduler.every(interval_hours).hours.do(self._run_once_safely)
+
+        # Stop cleanly on Ctrl-C / SIGTERM (signal handlers only work on the main thread)
+        self._previous_handlers = {}
+        if threading.current_thread() is threading.main_thread():
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                self._previous_handlers[sig] = signal.signal(sig, self._handle_stop_signal)
+
+        try:
+            self._run_once_safely()
+            while not self._stop_event.is_set():
+                self._scheduler.run_pending()
+                # Short waits keep shutdown responsive and avoid drift after suspend
+                self._stop_event.wait(1)
+        except KeyboardInterrupt:
+            # A second signal interrupted the run in progress
+            log.warning("\n⏹  Current run interrupted")
+        finally:
+            for sig, handler in self._previous_handlers.items():
+                signal.signal(sig, handler)
+            self._previous_handlers = {}
+            self._scheduler.clear()
+            self._stop_event.clear()
+
+        log.info("\n👋 Bot stopped")
+        _flush_log()
 
 
 # ============================================================================
 # USAGE EXAMPLES
 # ============================================================================
 
+def configure_logging(level: int = logging.INFO):
+    """
+    Send bot logs to stdout through a buffer, so output is written in batches
+    of up to 100 records (errors and the end of each run flush immediately).
+    Safe to call more than once; later calls only change the level.
+
+    Args:
+        level: Minimum level to log
+    """
+    log.setLevel(level)
+    # Keep bot output out of any root logging the host app sets up, so lines aren't doubled
+    log.propagate = False
+    if any(isinstance(handler, logging.handlers.MemoryHandler) for handler in log.handlers):
+        return
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter('%(message)s'))
+    log.addHandler(logging.handlers.MemoryHandler(
+        capacity=100, flushLevel=logging.ERROR, target=stream_handler
+    ))
+
+
+def _flush_log():
+    """Write out any log records still held in the buffer"""
+    for handler in log.handlers:
+        handler.flush()
+
+
 def example_usage():
     """Example of how to use the bot"""
 
@@ -525,6 +1146,8 @@ def example_usage():
         print("\nOr update line 419-420 in this file with your token")
         return
 
+    configure_logging()
+
     # Initialize bot
     # 📝 UPDATE THE CHANNEL NAME:
     bot = JobPostingBot(